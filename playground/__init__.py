@@ -0,0 +1 @@
+"""Kimi K2 playground demos"""
@@ -1,82 +1,263 @@
+import asyncio
+import functools
+import importlib.util
+import io
+import threading
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import lxml.html
+from lxml import etree
+from lxml.cssselect import CSSSelector
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import matplotlib
+matplotlib.use('Agg')  # Charts are only saved to disk; skip GUI backend startup
 import matplotlib.pyplot as plt
 import seaborn as sns
 import time
-import json
-from typing import List, Dict, Any
+import orjson
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Tuple
+from urllib.parse import urlsplit
+
+try:
+    import httpx
+except ImportError:  # Optional; scrape_quotes falls back to a thread pool
+    httpx = None
+
+try:
+    from requests_cache import CachedSession
+except ImportError:  # Optional; without it every run refetches every page
+    CachedSession = None
+
+# HTTP/2 in httpx needs the optional h2 package; without it the async path speaks HTTP/1.1
+HTTP2 = httpx is not None and importlib.util.find_spec('h2') is not None
+
+# numba is optional and only imported once a frame reaches NUMBA_MIN_ROWS; without it the
+# text features use Arrow's kernels at every size
+NUMBA = importlib.util.find_spec('numba') is not None
+
+# Both scraped sites serve UTF-8; one shared parser skips per-page encoding sniffing
+HTML_PARSER = lxml.html.HTMLParser(encoding='utf-8')
+
+def _has_class(name: str) -> str:
+    """XPath predicate matching a whole class token, like BeautifulSoup's class_ filter"""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+# Selectors are compiled once at import and reused for every page
+QUOTE_SEL = CSSSelector('div.quote', translator='html')
+TEXT_SEL = CSSSelector('span.text', translator='html')
+AUTHOR_SEL = CSSSelector('small.author', translator='html')
+TAG_SEL = CSSSelector('a.tag', translator='html')
+
+# The trending selectors need first-match and exact-class semantics that CSS can't express
+REPO_XP = etree.XPath(f"//article[{_has_class('Box-row')}]")
+# One union query finds every field of a repo in a single subtree walk, in document order:
+# the name links, the description paragraph, the stars span and the language span
+REPO_FIELDS_XP = etree.XPath(" | ".join([
+    f"(.//h2[{_has_class('h3')}])[1]//a",
+    f".//p[{_has_class('col-9')}]",
+    ".//span[normalize-space(@class)='d-inline-block float-sm-right']",
+    ".//span[@itemprop='programmingLanguage']",
+]))
+
+def _repo_field(element) -> str:
+    """Which REPO_FIELDS_XP branch matched an element"""
+    if element.tag == 'a':
+        return 'name'
+    if element.tag == 'p':
+        return 'description'
+    return 'language' if element.get('itemprop') == 'programmingLanguage' else 'stars'
+
+TABLE_CELLS_XP = etree.XPath("./th|./td")
+
+def _text(element) -> str:
+    """Text content as a plain str, so results don't keep the parsed tree alive"""
+    return str(element.text_content())
+
+def _parse_count(text: str) -> int:
+    """Leading number of a label like '1,234 stars today' as an int, or 0 if there isn't one"""
+    words = text.split(maxsplit=1)
+    try:
+        return int(words[0].replace(',', '')) if words else 0
+    except ValueError:
+        return 0
 
 class WebScraper:
-    def __init__(self, delay: float = 1.0):
+    def __init__(self, delay: float = 1.0, max_concurrency: int = 5,
+                 cache_name: Optional[str] = 'scrape_cache', cache_expire_after: int = 3600):
         self.delay = delay
-        self.session = requests.Session()
-        self.session.headers.update({
+        self.max_concurrency = max_concurrency
+        self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        })
+        }
+        
+        # Repeat runs within cache_expire_after seconds are served from a local SQLite cache
+        self.cached = cache_name is not None and CachedSession is not None
+        if self.cached:
+            self.session = CachedSession(cache_name, backend='sqlite', expire_after=cache_expire_after)
+        else:
+            self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        
+        # Enough pooled connections that concurrent fetches all reuse warm keep-alive sockets
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=max(32, max_concurrency),
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        
+        # Politeness is per host: requests to different hosts never wait on each other
+        self._host_last: Dict[str, float] = {}
+        self._host_lock = threading.Lock()
     
-    def get_page(self, url: str) -> BeautifulSoup:
-        """Fetch and parse a web page"""
+    def _wait_for_host(self, url: str) -> float:
+        """Reserve the next request slot for url's host and return how long to wait for it"""
+        # Fresh cache hits never reach the server, so there is nothing to be polite about;
+        # expired entries are refetched and wait like any other request
+        if self.cached:
+            key = self.session.cache.create_key(requests.Request('GET', url).prepare())
+            cached = self.session.cache.get_response(key)
+            if cached is not None and not cached.is_expired:
+                return 0.0
+        
+        host = urlsplit(url).netloc
+        with self._host_lock:
+            now = time.monotonic()
+            last = self._host_last.get(host)
+            slot = now if last is None else max(now, last + self.delay)
+            self._host_last[host] = slot
+        return slot - now
+    
+    def get_page(self, url: str, parse: bool = True) -> Tuple[Optional[bytes], Optional[lxml.html.HtmlElement]]:
+        """Fetch a page's raw bytes and, unless parse is False, its lxml tree from the same download"""
+        time.sleep(self._wait_for_host(url))
         try:
-            response = self.session.get(url)
-            response.raise_for_status()
-            time.sleep(self.delay)
-            return BeautifulSoup(response.content, 'lxml')
+            # feed() keeps its state on the parser, so each call needs its own to be thread-safe
+            parser = lxml.html.HTMLParser(encoding='utf-8') if parse else None
+            chunks = []
+            with self.session.get(url, stream=True) as response:
+                response.raise_for_status()
+                # iter_content undoes the content encoding; each chunk is parsed while the next downloads
+                for chunk in response.iter_content(chunk_size=64 * 1024):
+                    chunks.append(chunk)
+                    if parser is not None:
+                        parser.feed(chunk)
+            content = b''.join(chunks)
+            tree = parser.close() if parser is not None and content else None
+            return content, tree
         except requests.RequestException as e:
             print(f"Error fetching {url}: {e}")
-            return None
+            return None, None
     
-    def scrape_quotes(self, pages: int = 1) -> List[Dict[str, Any]]:
-        """Scrape quotes from quotes.toscrape.com"""
+    async def _get_tree_async(self, client: "httpx.AsyncClient", semaphore: asyncio.Semaphore,
+                              url: str) -> Optional[lxml.html.HtmlElement]:
+        """Fetch a page without blocking the event loop and parse it in a worker thread"""
+        # Slots are reserved in call order, so pages still go out in order, one delay apart per host
+        await asyncio.sleep(self._wait_for_host(url))
+        async with semaphore:
+            try:
+                response = await client.get(url)
+                response.raise_for_status()
+                content = response.content
+            except httpx.HTTPError as e:
+                print(f"Error fetching {url}: {e}")
+                return None
+        
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, functools.partial(lxml.html.fromstring, content, parser=HTML_PARSER))
+    
+    def _parse_quotes(self, tree: lxml.html.HtmlElement) -> List[Dict[str, Any]]:
+        """Extract the quotes on a single page"""
         quotes_data = []
         
-        for page in range(1, pages + 1):
-            url = f"http://quotes.toscrape.com/page/{page}/"
-            soup = self.get_page(url)
-            
-            if not soup:
-                continue
+        for quote in QUOTE_SEL(tree):
+            text = _text(TEXT_SEL(quote)[0])
+            author = _text(AUTHOR_SEL(quote)[0])
+            tags = [_text(tag) for tag in TAG_SEL(quote)]
             
-            quotes = soup.find_all('div', class_='quote')
-            
-            for quote in quotes:
-                text = quote.find('span', class_='text').get_text()
-                author = quote.find('small', class_='author').get_text()
-                tags = [tag.get_text() for tag in quote.find_all('a', class_='tag')]
-                
-                quotes_data.append({
-                    'text': text,
-                    'author': author,
-                    'tags': tags,
-                    'tags_count': len(tags)
-                })
+            quotes_data.append({
+                'text': text,
+                'author': author,
+                'tags': tags,
+                'tags_count': len(tags)
+            })
+        
+        return quotes_data
+    
+    async def scrape_quotes_async(self, pages: int = 1) -> List[Dict[str, Any]]:
+        """Scrape quotes from quotes.toscrape.com, fetching all pages concurrently"""
+        urls = [f"http://quotes.toscrape.com/page/{page}/" for page in range(1, pages + 1)]
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        # Over TLS with HTTP/2 every page is multiplexed on one connection instead of one socket each
+        transport = httpx.AsyncHTTPTransport(
+            http2=HTTP2,
+            retries=3,
+            limits=httpx.Limits(max_connections=self.max_concurrency, max_keepalive_connections=self.max_concurrency)
+        )
+        
+        async with httpx.AsyncClient(headers=self.headers, transport=transport,
+                                     follow_redirects=True, timeout=30.0) as client:
+            trees = await asyncio.gather(*(self._get_tree_async(client, semaphore, url) for url in urls))
+        
+        # gather keeps page order, so quotes come out in the same order as a sequential scrape
+        quotes_data = []
+        for tree in trees:
+            if tree is not None:
+                quotes_data.extend(self._parse_quotes(tree))
+        
+        return quotes_data
+    
+    def scrape_quotes_threaded(self, pages: int = 1) -> List[Dict[str, Any]]:
+        """Scrape quotes from quotes.toscrape.com, fetching pages on a thread pool"""
+        urls = [f"http://quotes.toscrape.com/page/{page}/" for page in range(1, pages + 1)]
+        
+        # Workers wait for their host's slot in get_page, so same-host requests stay one delay apart
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            trees = [tree for _, tree in executor.map(self.get_page, urls)]
+        
+        quotes_data = []
+        for tree in trees:
+            if tree is not None:
+                quotes_data.extend(self._parse_quotes(tree))
         
         return quotes_data
     
+    def scrape_quotes(self, pages: int = 1) -> List[Dict[str, Any]]:
+        """Scrape quotes from quotes.toscrape.com"""
+        # The async client bypasses the session, so prefer the threaded path when it has a cache
+        if httpx is None or self.cached:
+            return self.scrape_quotes_threaded(pages)
+        return asyncio.run(self.scrape_quotes_async(pages))
+    
     def scrape_github_trending(self, language: str = 'python') -> List[Dict[str, Any]]:
         """Scrape GitHub trending repositories"""
         url = f"https://github.com/trending/{language}"
-        soup = self.get_page(url)
+        _, tree = self.get_page(url)
         
-        if not soup:
+        if tree is None:
             return []
         
-        repos = soup.find_all('article', class_='Box-row')
+        repos = REPO_XP(tree)
         repos_data = []
         
         for repo in repos:
             try:
-                name_elem = repo.find('h2', class_='h3').find('a')
-                name = name_elem.get_text().strip().replace('\n', '').replace(' ', '')
+                # Keep the first match of each field, as separate per-field queries would
+                fields = {}
+                for element in REPO_FIELDS_XP(repo):
+                    fields.setdefault(_repo_field(element), element)
                 
-                description_elem = repo.find('p', class_='col-9')
-                description = description_elem.get_text().strip() if description_elem else "No description"
-                
-                stars_elem = repo.find('span', class_='d-inline-block float-sm-right')
-                stars = stars_elem.get_text().strip() if stars_elem else "0"
-                
-                language_elem = repo.find('span', itemprop='programmingLanguage')
-                language_name = language_elem.get_text().strip() if language_elem else "Unknown"
+                name = _text(fields['name']).strip().replace('\n', '').replace(' ', '')
+                description = _text(fields['description']).strip() if 'description' in fields else "No description"
+                stars = _parse_count(_text(fields['stars'])) if 'stars' in fields else 0
+                language_name = _text(fields['language']).strip() if 'language' in fields else "Unknown"
                 
                 repos_data.append({
                     'name': name,
@@ -92,12 +273,151 @@ class WebScraper:
     
     def scrape_table_data(self, url: str) -> pd.DataFrame:
         """Scrape tabular data from a webpage"""
-        soup = self.get_page(url)
-        if not soup:
+        # pandas does its own parse, so skip building a tree it would never see
+        content, _ = self.get_page(url, parse=False)
+        if content is None:
             return pd.DataFrame()
         
-        tables = pd.read_html(str(soup))
+        # Hand pandas the raw bytes instead of re-serializing a parsed tree for it to parse again
+        tables = pd.read_html(io.BytesIO(content))
         return tables[0] if tables else pd.DataFrame()
+    
+    def scrape_table_stream(self, url: str) -> pd.DataFrame:
+        """Scrape the first table on a page, parsing rows as they download instead of buffering the page"""
+        header = None
+        rows = []
+        
+        time.sleep(self._wait_for_host(url))
+        try:
+            with self.session.get(url, stream=True) as response:
+                response.raise_for_status()
+                response.raw.decode_content = True  # Undo gzip/deflate transfer encoding
+                
+                # Trust an explicit charset; otherwise assume UTF-8 rather than requests' latin-1 default
+                content_type = response.headers.get('Content-Type', '')
+                encoding = response.encoding if 'charset=' in content_type else 'utf-8'
+                
+                # Like pd.read_html(...)[0], only the first top-level table counts: rows of
+                # nested tables stay inside their cell, and parsing stops when it closes
+                depth = 0
+                for event, element in etree.iterparse(response.raw, events=('start', 'end'), tag=('table', 'tr'),
+                                                      html=True, encoding=encoding):
+                    if element.tag == 'table':
+                        depth += 1 if event == 'start' else -1
+                        if depth == 0:
+                            break
+                        continue
+                    if event != 'end' or depth != 1:
+                        continue
+                    
+                    row = element
+                    cells = TABLE_CELLS_XP(row)
+                    values = [''.join(cell.itertext()).strip() for cell in cells]
+                    
+                    if header is None and cells and all(cell.tag == 'th' for cell in cells):
+                        header = values
+                    elif values:
+                        rows.append(values)
+                    
+                    # Drop finished rows so memory stays bounded by one row, not the whole table
+                    row.clear()
+                    while row.getprevious() is not None:
+                        del row.getparent()[0]
+        except requests.RequestException as e:
+            print(f"Error fetching {url}: {e}")
+            return pd.DataFrame()
+        
+        if header and any(len(values) != len(header) for values in rows):
+            header = None  # Ragged rows; fall back to positional columns
+        df = pd.DataFrame(rows, columns=header)
+        
+        # Cells arrive as text; convert the numeric columns like pd.read_html does
+        for column in df.columns:
+            try:
+                df[column] = pd.to_numeric(df[column])
+            except (ValueError, TypeError):
+                pass
+        
+        return df
+
+# Below this many rows Arrow's kernels finish before a JIT-compiled kernel would even load
+NUMBA_MIN_ROWS = 100_000
+
+def _utf8_lengths(values: pd.Series):
+    """Character counts from Arrow's vectorized UTF-8 kernel"""
+    return pc.utf8_length(pa.array(values)).to_numpy().astype('int64')
+
+def _word_counts(values: pd.Series):
+    """Whitespace-separated word counts, matching len(str.split()), without building word lists"""
+    trimmed = pc.utf8_trim_whitespace(pa.array(values))
+    counts = pc.list_value_length(pc.utf8_split_whitespace(trimmed))
+    # Splitting an empty string still yields one empty word
+    return pc.if_else(pc.equal(pc.utf8_length(trimmed), 0), 0, counts).to_numpy().astype('int64')
+
+# Rebound to numba.prange when the kernel is compiled; plain range keeps _utf8_stats importable
+prange = range
+
+def _utf8_stats(data, offsets, lengths, words):
+    """Character and word counts for every string in one scan over the UTF-8 bytes
+
+    Plain Python here; _utf8_stats_kernel compiles it with numba on first use.
+    """
+    for i in prange(len(offsets) - 1):
+        chars = 0
+        count = 0
+        in_word = False
+        j = offsets[i]
+        end = offsets[i + 1]
+        while j < end:
+            lead = data[j]
+            # Decode just enough of each code point to test it for whitespace
+            if lead < 0x80:
+                cp, width = np.int64(lead), 1
+            elif lead < 0xE0:
+                cp, width = np.int64(lead & 0x1F) << 6 | (data[j + 1] & 0x3F), 2
+            elif lead < 0xF0:
+                cp, width = (np.int64(lead & 0x0F) << 12 | np.int64(data[j + 1] & 0x3F) << 6
+                             | (data[j + 2] & 0x3F)), 3
+            else:
+                cp, width = np.int64(0x10000), 4  # Nothing outside the BMP is whitespace
+            chars += 1
+            # The code points str.isspace() accepts
+            if ((9 <= cp <= 13) or (28 <= cp <= 32) or cp == 0x85 or cp == 0xA0 or cp == 0x1680
+                    or (0x2000 <= cp <= 0x200A) or cp == 0x2028 or cp == 0x2029 or cp == 0x202F
+                    or cp == 0x205F or cp == 0x3000):
+                in_word = False
+            elif not in_word:
+                in_word = True
+                count += 1
+            j += width
+        lengths[i] = chars
+        words[i] = count
+
+@functools.lru_cache(maxsize=1)
+def _utf8_stats_kernel():
+    """Import numba and compile _utf8_stats on first use; cache=True reuses the build across runs"""
+    global prange
+    import numba
+    prange = numba.prange
+    return numba.njit(parallel=True, cache=True)(_utf8_stats)
+
+def _text_stats(values: pd.Series):
+    """Character and word counts, as (text_length, word_count) int64 arrays"""
+    if not NUMBA or len(values) < NUMBA_MIN_ROWS:
+        return _utf8_lengths(values), _word_counts(values)
+    
+    # large_string gives int64 offsets however big the corpus; one chunk gives one contiguous buffer
+    array = pa.array(values).cast(pa.large_string())
+    if isinstance(array, pa.ChunkedArray):
+        array = array.combine_chunks()
+    _, offsets_buffer, data_buffer = array.buffers()
+    offsets = np.frombuffer(offsets_buffer, dtype=np.int64)[array.offset:array.offset + len(array) + 1]
+    data = np.frombuffer(data_buffer, dtype=np.uint8) if data_buffer is not None else np.zeros(0, np.uint8)
+    
+    lengths = np.empty(len(array), dtype=np.int64)
+    words = np.empty(len(array), dtype=np.int64)
+    _utf8_stats_kernel()(data, offsets, lengths, words)
+    return lengths, words
 
 class DataProcessor:
     @staticmethod
@@ -105,12 +425,16 @@ class DataProcessor:
         """Process quotes data into a pandas DataFrame"""
         df = pd.DataFrame(quotes)
         
-        # Explode tags to create separate rows
-        df_exploded = df.explode('tags')
+        # One (author, tag) row per tag, built straight from the scraped lists rather than exploding
+        # a copy of every column; only what the tag charts need is carried along
+        tag_rows = [(quote['author'], tag) for quote in quotes for tag in quote['tags']]
+        df_exploded = pd.DataFrame(tag_rows, columns=['author', 'tag'])
+        
+        # Arrow-backed strings let the features below run in Arrow's C kernels
+        df = df.astype({'text': 'string[pyarrow]', 'author': 'string[pyarrow]'})
         
         # Create additional features
-        df['text_length'] = df['text'].str.len()
-        df['word_count'] = df['text'].str.split().str.len()
+        df['text_length'], df['word_count'] = _text_stats(df['text'])
         
         return df, df_exploded
     
@@ -118,19 +442,33 @@ class DataProcessor:
     def process_github_data(repos: List[Dict[str, Any]]) -> pd.DataFrame:
         """Process GitHub data into a pandas DataFrame"""
         df = pd.DataFrame(repos)
-        
-        # Clean stars data
-        df['stars'] = df['stars'].str.replace(',', '').astype(float)
+        df = df.astype({'name': 'string[pyarrow]', 'description': 'string[pyarrow]'})
         
         # Create additional features
-        df['description_length'] = df['description'].str.len()
-        df['name_length'] = df['name'].str.len()
+        df['description_length'] = _utf8_lengths(df['description'])
+        df['name_length'] = _utf8_lengths(df['name'])
         
         return df
+    
+    @staticmethod
+    def save(df: pd.DataFrame, name: str, write_csv: bool = False):
+        """Save a DataFrame as typed, compressed Parquet, plus an optional CSV copy for humans"""
+        df.to_parquet(f'{name}.parquet', engine='pyarrow', compression='zstd', index=False)
+        if write_csv:
+            df.to_csv(f'{name}.csv', index=False)
+    
+    @staticmethod
+    def save_raw(records: List[Dict[str, Any]], name: str):
+        """Dump scraped records as collected, for debugging or reprocessing without refetching"""
+        with open(f'{name}_raw.json', 'wb') as f:
+            f.write(orjson.dumps(records, option=orjson.OPT_SERIALIZE_NUMPY))
+
+# Above this many points a scatter plot is drawn as a 2-D histogram
+SCATTER_MAX_POINTS = 10_000
 
 class Visualizer:
     @staticmethod
-    def create_quotes_visualizations(df: pd.DataFrame, df_exploded: pd.DataFrame):
+    def create_quotes_visualizations(df: pd.DataFrame, df_exploded: pd.DataFrame, dpi: int = 150):
         """Create visualizations for quotes data"""
         fig, axes = plt.subplots(2, 2, figsize=(15, 12))
         
@@ -141,7 +479,7 @@ class Visualizer:
         axes[0, 0].tick_params(axis='x', rotation=45)
         
         # Tags distribution
-        tag_counts = df_exploded['tags'].value_counts().head(10)
+        tag_counts = df_exploded['tag'].value_counts().head(10)
         axes[0, 1].bar(tag_counts.index, tag_counts.values)
         axes[0, 1].set_title('Top 10 Tags')
         axes[0, 1].tick_params(axis='x', rotation=45)
@@ -152,18 +490,26 @@ class Visualizer:
         axes[1, 0].set_xlabel('Character Count')
         axes[1, 0].set_ylabel('Frequency')
         
-        # Tags count vs text length scatter
-        axes[1, 1].scatter(df['tags_count'], df['text_length'], alpha=0.6)
+        # Tags count vs text length scatter; past SCATTER_MAX_POINTS, bin the points instead of
+        # drawing each one, which keeps render time and PNG size flat however many pages are scraped
+        if len(df) <= SCATTER_MAX_POINTS:
+            axes[1, 1].scatter(df['tags_count'], df['text_length'], alpha=0.6)
+        else:
+            tag_bins = np.arange(df['tags_count'].max() + 2) - 0.5  # One column per tag count
+            counts, x_edges, y_edges = np.histogram2d(df['tags_count'], df['text_length'], bins=(tag_bins, 50))
+            image = axes[1, 1].imshow(np.ma.masked_equal(counts.T, 0), origin='lower', aspect='auto', cmap='viridis',
+                                      extent=[x_edges[0], x_edges[-1], y_edges[0], y_edges[-1]])
+            fig.colorbar(image, ax=axes[1, 1], label='Quotes')
         axes[1, 1].set_title('Tags Count vs Text Length')
         axes[1, 1].set_xlabel('Number of Tags')
         axes[1, 1].set_ylabel('Text Length')
         
         plt.tight_layout()
-        plt.savefig('quotes_analysis.png', dpi=300, bbox_inches='tight')
-        plt.show()
+        fig.savefig('quotes_analysis.png', dpi=dpi, bbox_inches='tight')
+        plt.close(fig)
     
     @staticmethod
-    def create_github_visualizations(df: pd.DataFrame):
+    def create_github_visualizations(df: pd.DataFrame, dpi: int = 150):
         """Create visualizations for GitHub data"""
         fig, axes = plt.subplots(2, 2, figsize=(15, 12))
         
@@ -193,28 +539,36 @@ class Visualizer:
         axes[1, 1].set_title('Distribution by Programming Language')
         
         plt.tight_layout()
-        plt.savefig('github_analysis.png', dpi=300, bbox_inches='tight')
-        plt.show()
+        fig.savefig('github_analysis.png', dpi=dpi, bbox_inches='tight')
+        plt.close(fig)
 
-def main():
+def main(write_csv: bool = False, write_raw: bool = False):
     """Main function to run the complete pipeline"""
     print("Starting web scraping pipeline...")
     
     # Initialize scraper
     scraper = WebScraper(delay=1.0)
     
-    # Scrape quotes data
-    print("Scraping quotes data...")
-    quotes_data = scraper.scrape_quotes(pages=5)
+    # The two sites share nothing, so both scrapes run at once and the quotes are
+    # processed here while the GitHub page is still downloading
+    print("Scraping quotes data and GitHub trending repositories...")
+    executor = ThreadPoolExecutor(max_workers=2)
+    quotes_future = executor.submit(scraper.scrape_quotes, pages=5)
+    github_future = executor.submit(scraper.scrape_github_trending, 'python')
+    executor.shutdown(wait=False)
+    
+    quotes_data = quotes_future.result()
+    if write_raw:
+        DataProcessor.save_raw(quotes_data, 'quotes')
     
     if quotes_data:
         # Process quotes data
         print("Processing quotes data...")
         quotes_df, quotes_exploded = DataProcessor.process_quotes_data(quotes_data)
         
-        # Save to CSV
-        quotes_df.to_csv('quotes_data.csv', index=False)
-        quotes_exploded.to_csv('quotes_exploded.csv', index=False)
+        # Save to Parquet
+        DataProcessor.save(quotes_df, 'quotes_data', write_csv)
+        DataProcessor.save(quotes_exploded, 'quotes_exploded', write_csv)
         
         # Create visualizations
         print("Creating visualizations...")
@@ -222,17 +576,17 @@ def main():
         
         print(f"Quotes analysis complete! Processed {len(quotes_df)} quotes.")
     
-    # Scrape GitHub trending data
-    print("Scraping GitHub trending repositories...")
-    github_data = scraper.scrape_github_trending('python')
+    github_data = github_future.result()
+    if write_raw:
+        DataProcessor.save_raw(github_data, 'github_trending')
     
     if github_data:
         # Process GitHub data
         print("Processing GitHub data...")
         github_df = DataProcessor.process_github_data(github_data)
         
-        # Save to CSV
-        github_df.to_csv('github_trending.csv', index=False)
+        # Save to Parquet
+        DataProcessor.save(github_df, 'github_trending', write_csv)
         
         # Create visualizations
         Visualizer.create_github_visualizations(github_df)